@@ -193,8 +193,8 @@ def create_field():
                 "message": "Failed to create field"
             }), 500
         
-        # Get created field data
-        created_field = fields_repo.get_field_by_id(field_id)
+        # Get created field data (from the primary - the replica may lag)
+        created_field = fields_repo.get_field_by_id(field_id, use_primary=True)
         
         return jsonify({
             "status": "success",
@@ -338,8 +338,8 @@ def import_fields():
                 "message": "Import data cannot be empty"
             }), 400
         
-        results = []
-        successful_imports = 0
+        results = {}
+        valid_rows = []
         
         for i, field_data in enumerate(import_data):
             try:
@@ -348,11 +348,11 @@ def import_fields():
                 missing_fields = [f for f in required_fields if f not in field_data]
                 
                 if missing_fields:
-                    results.append({
+                    results[i] = {
                         "row": i + 1,
                         "status": "error",
                         "message": f"Missing fields: {', '.join(missing_fields)}"
-                    })
+                    }
                     continue
                 
                 # Validate crop if provided
@@ -360,37 +360,43 @@ def import_fields():
                     try:
                         field_data['crop'] = validate_crop(field_data['crop'])
                     except ValueError as e:
-                        results.append({
+                        results[i] = {
                             "row": i + 1,
                             "status": "error",
                             "message": str(e)
-                        })
+                        }
                         continue
                 
-                # Create field
-                field_id = fields_repo.create_field(field_data)
-                
-                if field_id:
-                    results.append({
-                        "row": i + 1,
-                        "status": "success",
-                        "field_id": field_id,
-                        "name": field_data['name']
-                    })
-                    successful_imports += 1
-                else:
-                    results.append({
-                        "row": i + 1,
-                        "status": "error",
-                        "message": "Failed to create field"
-                    })
+                valid_rows.append(i)
                 
             except Exception as e:
-                results.append({
+                results[i] = {
                     "row": i + 1,
                     "status": "error",
                     "message": str(e)
-                })
+                }
+        
+        # Create all valid fields in one transaction
+        field_ids = fields_repo.create_fields([import_data[i] for i in valid_rows])
+        
+        successful_imports = 0
+        for i, field_id in zip(valid_rows, field_ids):
+            if field_id:
+                results[i] = {
+                    "row": i + 1,
+                    "status": "success",
+                    "field_id": field_id,
+                    "name": import_data[i]['name']
+                }
+                successful_imports += 1
+            else:
+                results[i] = {
+                    "row": i + 1,
+                    "status": "error",
+                    "message": "Failed to create field"
+                }
+        
+        results = [results[i] for i in sorted(results)]
         
         return jsonify({
             "status": "success",
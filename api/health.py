@@ -116,9 +116,7 @@ def database_health():
         # Test table access
         table_status = {}
         try:
-            with db.get_connection() as conn:
-                cursor = conn.cursor()
-                
+            with db.get_connection() as conn, conn.cursor() as cursor:
                 # Check fields table
                 cursor.execute("SELECT COUNT(*) FROM fields")
                 fields_count = cursor.fetchone()[0]
@@ -141,8 +139,6 @@ def database_health():
                         "note": "Table may not exist yet"
                     }
                 
-                cursor.close()
-                
         except Exception as e:
             table_status["error"] = str(e)
         
@@ -4,18 +4,22 @@ Implements rainfall-only planting detection and detailed analysis
 """
 
 from flask import Blueprint, request, jsonify
-import traceback
+import logging
 import time
-from datetime import datetime
+import numpy as np
+from datetime import datetime, timezone
 from typing import Dict, List, Any
 
 from core.quote_engine import QuoteEngine  # Updated to use existing file
 from core.database import FieldsRepository, QuotesRepository
 from core.ai_summary import EnhancedAISummaryGenerator
-from core.crops import validate_crop, list_supported_crops
+from core.crops import validate_crop, list_supported_crops, is_within_southern_africa
 
 quotes_bp = Blueprint('quotes', __name__)
 
+# Tracebacks are formatted by the handler, only when a record is emitted
+logger = logging.getLogger(__name__)
+
 # Initialize components with enhanced engine
 quote_engine = QuoteEngine()  # Updated to use existing class
 fields_repo = FieldsRepository()
@@ -85,7 +89,7 @@ def historical_quote():
         })
         
     except Exception as e:
-        print(f"Refined historical quote error: {traceback.format_exc()}")
+        logger.exception("Refined historical quote error")
         return jsonify({
             "status": "error",
             "message": str(e),
@@ -173,7 +177,7 @@ def prospective_quote():
         })
         
     except Exception as e:
-        print(f"Refined prospective quote error: {traceback.format_exc()}")
+        logger.exception("Refined prospective quote error")
         return jsonify({
             "status": "error",
             "message": str(e),
@@ -320,9 +324,7 @@ def field_based_quote(field_id):
         })
         
     except Exception as e:
-        print(f"=== REFINED FIELD QUOTE ERROR FOR FIELD {field_id} ===")
-        print(f"Error: {e}")
-        print(f"Full traceback: {traceback.format_exc()}")
+        logger.exception("Refined field quote error for field %s", field_id)
         
         return jsonify({
             "status": "error",
@@ -483,7 +485,7 @@ def bulk_quote():
         })
         
     except Exception as e:
-        print(f"Refined bulk quote error: {traceback.format_exc()}")
+        logger.exception("Refined bulk quote error")
         return jsonify({
             "status": "error",
             "message": str(e),
@@ -539,22 +541,30 @@ def get_simulation_details(quote_id):
             
             enhanced_simulation.append(enhanced_year)
         
+        # One extraction pass into arrays, then C-level reductions for the summary
+        year_metrics = np.array([
+            (y.get('drought_impact', 0), y.get('simulated_premium_usd', 0), y.get('simulated_payout', 0))
+            for y in simulation_data
+        ], dtype=np.float64)
+        impacts = year_metrics[:, 0]
+        average_premium, average_payout = year_metrics[:, 1:].mean(axis=0).tolist()
+        
         return jsonify({
             "status": "success",
             "quote_id": quote_id,
             "simulation_data": enhanced_simulation,
             "summary_statistics": {
                 "total_years": len(simulation_data),
-                "years_with_payouts": len([y for y in simulation_data if y.get('drought_impact', 0) > 5]),
-                "average_premium": sum(y.get('simulated_premium_usd', 0) for y in simulation_data) / len(simulation_data),
-                "average_payout": sum(y.get('simulated_payout', 0) for y in simulation_data) / len(simulation_data),
-                "worst_year": max(simulation_data, key=lambda x: x.get('drought_impact', 0))['year'],
-                "best_year": min(simulation_data, key=lambda x: x.get('drought_impact', 0))['year']
+                "years_with_payouts": int(np.count_nonzero(impacts > 5)),
+                "average_premium": average_premium,
+                "average_payout": average_payout,
+                "worst_year": simulation_data[int(impacts.argmax())]['year'],
+                "best_year": simulation_data[int(impacts.argmin())]['year']
             }
         })
         
     except Exception as e:
-        print(f"Simulation details error: {traceback.format_exc()}")
+        logger.exception("Simulation details error")
         return jsonify({
             "status": "error",
             "message": str(e)
@@ -612,7 +622,7 @@ def test_refined_features():
         })
         
     except Exception as e:
-        print(f"Refined features test error: {traceback.format_exc()}")
+        logger.exception("Refined features test error")
         return jsonify({
             "status": "error",
             "message": str(e),
@@ -654,7 +664,7 @@ def get_quote(quote_id):
         return jsonify(response_data)
         
     except Exception as e:
-        print(f"Get quote error: {traceback.format_exc()}")
+        logger.exception("Get quote error")
         return jsonify({
             "status": "error",
             "message": str(e)
@@ -692,7 +702,7 @@ def get_field_quote_history(field_id):
         })
         
     except Exception as e:
-        print(f"Get field quotes error: {traceback.format_exc()}")
+        logger.exception("Get field quotes error")
         return jsonify({
             "status": "error",
             "message": str(e)
@@ -770,7 +780,7 @@ def validate_quote_request():
             try:
                 lat = float(data['latitude'])
                 lon = float(data['longitude'])
-                if not (-25 <= lat <= -15 and 25 <= lon <= 35):
+                if not is_within_southern_africa(lat, lon):
                     validation_warnings.append("Coordinates appear to be outside Southern Africa region")
             except:
                 pass  # Already caught in numeric validation
@@ -823,7 +833,7 @@ def validate_quote_request():
         return jsonify(response)
         
     except Exception as e:
-        print(f"Validation error: {traceback.format_exc()}")
+        logger.exception("Validation error")
         return jsonify({
             "status": "error",
             "message": str(e)
@@ -858,7 +868,7 @@ def generate_detailed_report(quote_id):
                 "status": "success",
                 "quote_id": quote_id,
                 "report": comprehensive_report,
-                "generated_at": datetime.utcnow().isoformat(),
+                "generated_at": datetime.now(timezone.utc).isoformat(),
                 "report_version": "2.1.0-Refined"
             })
             
@@ -871,7 +881,7 @@ def generate_detailed_report(quote_id):
             }), 500
         
     except Exception as e:
-        print(f"Detailed report error: {traceback.format_exc()}")
+        logger.exception("Detailed report error")
         return jsonify({
             "status": "error",
             "message": str(e)
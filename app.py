@@ -4,7 +4,9 @@ Enhanced backend with rainfall-only planting detection and year-by-year simulati
 """
 
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+import logging
 import os
 import traceback
 import json
@@ -19,6 +21,14 @@ from api.quotes import quotes_bp  # Updated with refined features
 from api.fields import fields_bp
 from api.health import health_bp
 
+# Try to import orjson for response serialization, with stdlib json fallback
+try:
+    import orjson
+    USING_ORJSON = True
+except ImportError:
+    USING_ORJSON = False
+    print("INFO: orjson not installed - responses serialized with stdlib json")
+
 def ensure_json_serializable(obj):
     """Ensure all data types in the object are JSON serializable"""
     if isinstance(obj, dict):
@@ -38,10 +48,46 @@ def ensure_json_serializable(obj):
     else:
         return obj
 
+def _orjson_default(obj):
+    """
+    Types orjson does not serialize natively (same conversions as ensure_json_serializable)
+    
+    Anything else raises TypeError, as the stdlib provider does, so an
+    unexpected type is an error rather than a silently stringified value.
+    """
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if hasattr(obj, '__dict__'):
+        return ensure_json_serializable(obj.__dict__)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson
+    
+    NumPy scalars/arrays, dates and non-string keys are serialized natively,
+    so responses need no ensure_json_serializable pass. Anything orjson
+    rejects (e.g. integers beyond 64 bits) falls back to the stdlib encoder.
+    Request bodies are still parsed by the stdlib provider, which accepts
+    the NaN/Infinity literals orjson rejects.
+    """
+    
+    OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS if USING_ORJSON else 0
+    
+    def dumps(self, obj, **kwargs):
+        try:
+            return orjson.dumps(obj, default=_orjson_default, option=self.OPTIONS).decode()
+        except TypeError:
+            return super().dumps(ensure_json_serializable(obj), **kwargs)
+
 def create_app():
     """Application factory pattern with refined features"""
+    logging.basicConfig(level=Config.LOG_LEVEL, format='%(levelname)s: %(name)s: %(message)s')
+    
     app = Flask(__name__)
     app.config.from_object(Config)
+    if USING_ORJSON:
+        app.json = OrjsonProvider(app)
     
     # Enhanced CORS configuration
     CORS(app, resources={
@@ -105,8 +151,9 @@ def create_app():
             response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE, OPTIONS'
             response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, X-Requested-With'
         
-        # Ensure JSON response with proper serialization
-        if response.content_type and 'application/json' in response.content_type:
+        # Ensure JSON response with proper serialization (the orjson provider
+        # already serializes these types, so the re-encode pass is skipped)
+        if not USING_ORJSON and response.content_type and 'application/json' in response.content_type:
             try:
                 data = response.get_json()
                 if data:
@@ -11,6 +11,7 @@ class Config:
     # Flask settings
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'yieldera-dev-key-change-in-production'
     FLASK_ENV = os.environ.get('FLASK_ENV', 'production')
+    LOG_LEVEL = os.environ.get('LOG_LEVEL', 'WARNING').upper()  # Per-quote engine progress logs at INFO/DEBUG
     
     # Database configuration
     DB_HOST = os.environ.get('DB_HOST')
@@ -18,6 +19,15 @@ class Config:
     DB_NAME = os.environ.get('DB_NAME')
     DB_USER = os.environ.get('DB_USER')
     DB_PASSWORD = os.environ.get('DB_PASSWORD')
+    # Connections per pool (per process). Keep this at least gunicorn --threads + 1:
+    # MySQLConnectionPool does not queue, so checkouts beyond it wait up to
+    # DB_POOL_TIMEOUT seconds for a connection to be returned, then fail
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+    DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', 10))
+    
+    # Read replica (optional) - SELECT paths fall back to the primary when unset
+    DB_RO_HOST = os.environ.get('DB_RO_HOST')
+    DB_RO_PORT = int(os.environ.get('DB_RO_PORT', DB_PORT))
     
     # Google Earth Engine
     GOOGLE_APPLICATION_CREDENTIALS = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
@@ -30,6 +40,11 @@ class Config:
     # CHIRPS/GEE settings
     CHIRPS_COLLECTION_ID = 'UCSB-CHG/CHIRPS/DAILY'
     CHIRPS_SCALE = 5566
+    GEE_API_URL = os.environ.get('GEE_API_URL', 'https://earthengine-highvolume.googleapis.com')  # High-volume endpoint for parallel requests
+    GEE_MAX_WORKERS = int(os.environ.get('GEE_MAX_WORKERS', 32))  # Concurrent EE requests (high-volume endpoint)
+    GEE_MAX_RETRIES = int(os.environ.get('GEE_MAX_RETRIES', 5))  # Attempts for throttled/transient EE errors
+    GEE_RESULT_CACHE_SIZE = int(os.environ.get('GEE_RESULT_CACHE_SIZE', 4096))  # Cached seasons/chunks per process
+    GEE_RESULT_CACHE_TTL_DAYS = int(os.environ.get('GEE_RESULT_CACHE_TTL_DAYS', 30))
     
     # Quote engine defaults
     DEFAULT_DEDUCTIBLE = 0.05  # 5%
@@ -7,6 +7,41 @@ import openai
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+def _scan_historical_simulation(historical_simulation: list, default_year: int) -> tuple:
+    """
+    Single pass over the per-year simulation rows used by the executive summary
+    
+    Args:
+        historical_simulation: Per-year rows from the quote result
+        default_year: Year assumed for rows without one
+    
+    Returns:
+        tuple: (worst_year_data, best_year_data, first_year, last_year, valid_seasons);
+               the rows and years are None when there is no simulation
+    """
+    worst_year_data = best_year_data = first_year = last_year = None
+    worst_impact = best_impact = None
+    valid_seasons = 0
+    
+    for row in historical_simulation:
+        impact = row.get('drought_impact_pct', 0)
+        # Strict comparisons keep the first extreme, as max()/min() do
+        if worst_impact is None or impact > worst_impact:
+            worst_year_data, worst_impact = row, impact
+        if best_impact is None or impact < best_impact:
+            best_year_data, best_impact = row, impact
+        
+        row_year = row.get('year', default_year)
+        if first_year is None or row_year < first_year:
+            first_year = row_year
+        if last_year is None or row_year > last_year:
+            last_year = row_year
+        
+        if row.get('drought_impact_pct') is not None:
+            valid_seasons += 1
+    
+    return worst_year_data, best_year_data, first_year, last_year, valid_seasons
+
 class EnhancedAISummaryGenerator:
     """Enhanced AI-powered summary generator with actuarial-focused executive summaries"""
     
@@ -111,12 +146,8 @@ class EnhancedAISummaryGenerator:
         
         # Analyze historical simulation for worst/best years
         historical_simulation = quote_result.get('historical_simulation', [])
-        worst_year_data = None
-        best_year_data = None
-        
-        if historical_simulation:
-            worst_year_data = max(historical_simulation, key=lambda x: x.get('drought_impact_pct', 0))
-            best_year_data = min(historical_simulation, key=lambda x: x.get('drought_impact_pct', 0))
+        worst_year_data, best_year_data, first_year, last_year, valid_seasons = \
+            _scan_historical_simulation(historical_simulation, year)
         
         # Determine variability interpretation
         if drought_volatility < 8:
@@ -140,8 +171,8 @@ class EnhancedAISummaryGenerator:
         )
         
         # 2. Historical Risk Profile
-        historical_period_start = min(h.get('year', year) for h in historical_simulation) if historical_simulation else year - years_analyzed + 1
-        historical_period_end = max(h.get('year', year) for h in historical_simulation) if historical_simulation else year - 1
+        historical_period_start = first_year if historical_simulation else year - years_analyzed + 1
+        historical_period_end = last_year if historical_simulation else year - 1
         
         summary_parts.append(
             f"**Historical Risk Profile ({historical_period_start}-{historical_period_end}):** "
@@ -175,7 +206,6 @@ class EnhancedAISummaryGenerator:
             )
         
         # 4. Actuarial Basis
-        valid_seasons = len([h for h in historical_simulation if h.get('drought_impact_pct') is not None])
         summary_parts.append(
             f"**Actuarial Basis:** "
             f"This quote uses {methodology.lower()} applied to daily CHIRPS precipitation data. "
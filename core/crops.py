@@ -3,9 +3,20 @@ Crop configuration and phenology management - FAO-56 Compliant
 Updated with proper FAO-56 Kc values and climate adjustment capabilities
 """
 
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, NamedTuple
+from functools import lru_cache
 import math
 
+class CropPhase(NamedTuple):
+    """Crop growth phase (a plain tuple, so positional unpacking and JSON output still work)"""
+    start_day: int
+    end_day: int
+    trigger_mm: float
+    exit_mm: float
+    phase_name: str
+    water_need_mm: float
+    obs_window: int
+
 # Enhanced multi-crop configuration with FAO-56 aligned Kc values
 CROP_CONFIG = {
     "maize": {
@@ -146,6 +157,10 @@ CROP_CONFIG = {
     }
 }
 
+# Phase tuples as CropPhase for named field access
+for _crop_config in CROP_CONFIG.values():
+    _crop_config["phases"] = [CropPhase(*phase) for phase in _crop_config["phases"]]
+
 # Agroecological Zone Configuration
 AGROECOLOGICAL_ZONES = {
     "aez_3_midlands": {
@@ -186,6 +201,9 @@ AGROECOLOGICAL_ZONES = {
     }
 }
 
+# Typical Southern Africa coverage area (min_lat, max_lat, min_lon, max_lon)
+SOUTHERN_AFRICA_BOUNDS = (-25.0, -15.0, 25.0, 35.0)
+
 # Crop aliases for user-friendly input
 CROP_ALIASES = {
     "corn": "maize",
@@ -196,6 +214,7 @@ CROP_ALIASES = {
     "groundnut": "groundnuts"
 }
 
+@lru_cache(maxsize=128)
 def validate_crop(crop: str) -> str:
     """
     Validate and normalize crop name
@@ -239,7 +258,7 @@ def get_crop_config(crop: str) -> Dict[str, Any]:
     validated_crop = validate_crop(crop)
     return CROP_CONFIG[validated_crop]
 
-def get_crop_phases(crop: str) -> List[Tuple[int, int, int, int, str, int, int]]:
+def get_crop_phases(crop: str) -> List[CropPhase]:
     """
     Get crop phases configuration
     
@@ -247,7 +266,7 @@ def get_crop_phases(crop: str) -> List[Tuple[int, int, int, int, str, int, int]]
         crop: Crop name
         
     Returns:
-        list: List of phase tuples (start_day, end_day, trigger_mm, exit_mm, phase_name, water_need_mm, observation_window_days)
+        list: List of CropPhase tuples (start_day, end_day, trigger_mm, exit_mm, phase_name, water_need_mm, obs_window)
     """
     config = get_crop_config(crop)
     return config["phases"]
@@ -263,8 +282,13 @@ def get_crop_phase_weights(crop: str, zone: str = "auto_detect") -> List[float]:
     Returns:
         list: Adjusted phase weights
     """
-    config = get_crop_config(crop)
-    base_weights = config["phase_weights"]
+    # Fresh list per call so callers can't modify the cached weights
+    return list(_zone_adjusted_weights(validate_crop(crop), zone))
+
+@lru_cache(maxsize=128)
+def _zone_adjusted_weights(crop: str, zone: str) -> Tuple[float, ...]:
+    """Zone-adjusted phase weights for a validated crop name (memoized)"""
+    base_weights = CROP_CONFIG[crop]["phase_weights"]
     
     zone_config = AGROECOLOGICAL_ZONES.get(zone, AGROECOLOGICAL_ZONES["auto_detect"])
     adjustments = zone_config["phase_weight_adjustments"]
@@ -275,7 +299,7 @@ def get_crop_phase_weights(crop: str, zone: str = "auto_detect") -> List[float]:
         adjusted_weight = base_weight * adjustments[i]
         adjusted_weights.append(adjusted_weight)
     
-    return adjusted_weights
+    return tuple(adjusted_weights)
 
 def get_zone_config(zone: str) -> Dict[str, Any]:
     """
@@ -289,6 +313,21 @@ def get_zone_config(zone: str) -> Dict[str, Any]:
     """
     return AGROECOLOGICAL_ZONES.get(zone, AGROECOLOGICAL_ZONES["auto_detect"])
 
+@lru_cache(maxsize=1024)
+def is_within_southern_africa(latitude: float, longitude: float) -> bool:
+    """
+    Check whether coordinates fall inside the typical Southern Africa coverage area
+    
+    Args:
+        latitude: Latitude in decimal degrees
+        longitude: Longitude in decimal degrees
+    
+    Returns:
+        bool: True if inside SOUTHERN_AFRICA_BOUNDS
+    """
+    min_lat, max_lat, min_lon, max_lon = SOUTHERN_AFRICA_BOUNDS
+    return min_lat <= latitude <= max_lat and min_lon <= longitude <= max_lon
+
 def adjust_kc_for_climate(crop: str, zone: str = "auto_detect", 
                          custom_rh_min: float = None, custom_wind_speed: float = None) -> Dict[str, float]:
     """
@@ -358,10 +397,10 @@ def list_supported_crops() -> Dict[str, Dict[str, Any]]:
         phases = config["phases"]
         crops_info[crop_name] = {
             "description": config.get("description", ""),
-            "total_season_days": config.get("total_season_days", phases[-1][1]),
+            "total_season_days": config.get("total_season_days", phases[-1].end_day),
             "phases_count": len(phases),
             "default_planting_date": config.get("default_planting_date", "11-15"),
-            "phase_names": [phase[4] for phase in phases],
+            "phase_names": [phase.phase_name for phase in phases],
             "phase_weights": config["phase_weights"],
             "kc_values": config["kc_values"],
             "crop_height_m": config.get("crop_height_m", 1.0),
@@ -421,22 +460,22 @@ class CropPhenologyCalculator:
         planting_dt = datetime.strptime(self.planting_date, '%Y-%m-%d')
         phases = []
         
-        for i, (start_day, end_day, trigger_mm, exit_mm, phase_name, water_need_mm, obs_window) in enumerate(self.config["phases"]):
-            start_date = planting_dt + timedelta(days=start_day)
-            end_date = planting_dt + timedelta(days=end_day)
+        for i, phase in enumerate(self.config["phases"]):
+            start_date = planting_dt + timedelta(days=phase.start_day)
+            end_date = planting_dt + timedelta(days=phase.end_day)
             
             phases.append({
                 "phase_number": i + 1,
-                "phase_name": phase_name,
-                "start_day": start_day,
-                "end_day": end_day,
+                "phase_name": phase.phase_name,
+                "start_day": phase.start_day,
+                "end_day": phase.end_day,
                 "start_date": start_date.strftime('%Y-%m-%d'),
                 "end_date": end_date.strftime('%Y-%m-%d'),
-                "duration_days": end_day - start_day + 1,
-                "trigger_mm": trigger_mm,
-                "exit_mm": exit_mm,
-                "water_need_mm": water_need_mm,
-                "observation_window_days": obs_window
+                "duration_days": phase.end_day - phase.start_day + 1,
+                "trigger_mm": phase.trigger_mm,
+                "exit_mm": phase.exit_mm,
+                "water_need_mm": phase.water_need_mm,
+                "observation_window_days": phase.obs_window
             })
         
         return phases
@@ -519,7 +558,7 @@ def get_crop_summary_stats() -> Dict[str, Any]:
     total_zones = len(AGROECOLOGICAL_ZONES)
     
     # Calculate average season lengths
-    season_lengths = [config.get("total_season_days", config["phases"][-1][1]) for config in CROP_CONFIG.values()]
+    season_lengths = [config.get("total_season_days", config["phases"][-1].end_day) for config in CROP_CONFIG.values()]
     avg_season_length = sum(season_lengths) / len(season_lengths)
     
     # Calculate average Kc values
@@ -4,13 +4,26 @@ Database management - QUICK FIX for location bytearray issue
 
 import mysql.connector
 from mysql.connector import Error
+from mysql.connector.errors import PoolError
+from mysql.connector.pooling import MySQLConnectionPool
 import json
+import logging
+import threading
+import time
 from datetime import datetime, date
 from typing import Dict, List, Optional, Any
 from contextlib import contextmanager
 from config import Config
 import decimal
-import traceback
+
+logger = logging.getLogger(__name__)
+
+# Connection pools are shared by every DatabaseManager instance (one per role)
+_connection_pools = {}
+_connection_pools_lock = threading.Lock()
+
+# Delay between checkout attempts while a pool is exhausted
+POOL_RETRY_INTERVAL = 0.05
 
 class DatabaseManager:
     """Manages database connections and operations"""
@@ -28,32 +41,110 @@ class DatabaseManager:
             'connect_timeout': 30,
             'sql_mode': 'TRADITIONAL'
         }
+        
+        # Read replica config - same credentials, different host
+        self.ro_config = dict(self.config, host=Config.DB_RO_HOST, port=Config.DB_RO_PORT)
+    
+    def _get_pool(self, role: str, config: Dict[str, Any]) -> MySQLConnectionPool:
+        """Lazily create the shared connection pool for a role"""
+        pool = _connection_pools.get(role)
+        if pool is None:
+            with _connection_pools_lock:
+                pool = _connection_pools.get(role)
+                if pool is None:
+                    pool = MySQLConnectionPool(
+                        pool_name=f"yieldera_{role}",
+                        pool_size=Config.DB_POOL_SIZE,
+                        **config
+                    )
+                    _connection_pools[role] = pool
+        return pool
+    
+    @property
+    def primary_pool(self) -> MySQLConnectionPool:
+        """Pool targeting the primary (all writes)"""
+        return self._get_pool('primary', self.config)
+    
+    @property
+    def replica_pool(self) -> MySQLConnectionPool:
+        """Pool targeting the read replica, or the primary if no replica is configured"""
+        if not Config.DB_RO_HOST:
+            return self.primary_pool
+        return self._get_pool('replica', self.ro_config)
     
     @contextmanager
-    def get_connection(self):
-        """Context manager for database connections"""
+    def _pooled_connection(self, pool: MySQLConnectionPool):
+        """Borrow a connection from a pool and return it on exit"""
         connection = None
         try:
-            connection = mysql.connector.connect(**self.config)
+            connection = self._checkout(pool)
             yield connection
         except Error as e:
-            print(f"Database error: {e}")
+            logger.error("Database error: %s", e)
             raise
         finally:
-            if connection and connection.is_connected():
-                connection.close()
+            # close() hands a pooled connection back to the pool, even a dropped
+            # one (the pool resets it); skipping it would leak the pool slot
+            if connection is not None:
+                try:
+                    connection.close()
+                except Error as e:
+                    # Session reset failed on a dead link; the pool reconnects it on next checkout
+                    logger.warning("Database error returning connection to pool: %s", e)
+    
+    @staticmethod
+    def _checkout(pool: MySQLConnectionPool):
+        """
+        Take a connection from a pool, waiting while it is exhausted
+        
+        get_connection() raises PoolError at once when every connection is
+        checked out, so short bursts beyond DB_POOL_SIZE are absorbed here by
+        retrying until Config.DB_POOL_TIMEOUT seconds have passed.
+        """
+        deadline = time.monotonic() + Config.DB_POOL_TIMEOUT
+        while True:
+            try:
+                return pool.get_connection()
+            except PoolError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(POOL_RETRY_INTERVAL)
+    
+    def get_connection(self):
+        """Context manager for primary (read/write) database connections"""
+        return self._pooled_connection(self.primary_pool)
+    
+    def get_ro_connection(self):
+        """Context manager for read-only connections routed to the replica"""
+        return self._pooled_connection(self.replica_pool)
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Primary connection wrapped in an explicit transaction for batch writes
+        
+        Connections run with autocommit (one commit/fsync per statement). Batch
+        writers use this instead so the whole batch pays for a single commit;
+        the trade-off is that a failure rolls back every row in the batch.
+        """
+        with self.get_connection() as conn:
+            conn.start_transaction()
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
     
     def test_connection(self) -> bool:
         """Test database connectivity"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
+            with self.get_connection() as conn, conn.cursor() as cursor:
                 cursor.execute("SELECT 1")
                 result = cursor.fetchone()
-                cursor.close()
                 return result[0] == 1
         except Exception as e:
-            print(f"Database connection test failed: {e}")
+            logger.error("Database connection test failed: %s", e)
             return False
 
 def clean_database_value(value):
@@ -116,30 +207,38 @@ def safe_numeric_conversion(value, field_name="unknown"):
         try:
             return float(cleaned_str)
         except ValueError:
-            print(f"Warning: Could not convert {field_name} to float: '{cleaned_str}'")
+            logger.warning("Could not convert %s to float: '%s'", field_name, cleaned_str)
             return None
     
     # Try to convert other types
     try:
         return float(cleaned_value)
     except (ValueError, TypeError):
-        print(f"Warning: Could not convert {field_name} to float: {cleaned_value} (type: {type(cleaned_value)})")
+        logger.warning("Could not convert %s to float: %s (type: %s)", field_name, cleaned_value, type(cleaned_value))
         return None
 
+def _coords_ok(latitude, longitude) -> bool:
+    """Check a (latitude, longitude) pair is within valid ranges"""
+    try:
+        return -90 <= float(latitude) <= 90 and -180 <= float(longitude) <= 180
+    except (ValueError, TypeError):
+        return False
+
 class FieldsRepository:
     """Repository for field-related database operations with enhanced data cleaning"""
     
     def __init__(self):
         self.db = DatabaseManager()
     
-    def get_field_by_id(self, field_id: int) -> Optional[Dict[str, Any]]:
+    def get_field_by_id(self, field_id: int, use_primary: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get field data by ID with comprehensive data cleaning
+        
+        Reads go to the replica unless use_primary is set (read-after-write)
         """
         try:
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor(dictionary=True)
-                
+            connection = self.db.get_connection() if use_primary else self.db.get_ro_connection()
+            with connection as conn, conn.cursor(dictionary=True) as cursor:
                 query = """
                 SELECT 
                     id, farm_id, name, farmer_name, farmer_phone,
@@ -152,7 +251,6 @@ class FieldsRepository:
                 
                 cursor.execute(query, (field_id,))
                 raw_field_data = cursor.fetchone()
-                cursor.close()
                 
                 if not raw_field_data:
                     return None
@@ -167,31 +265,32 @@ class FieldsRepository:
                     if key == 'location' and isinstance(value, bytearray):
                         field_data[key] = "GEOMETRY_POLYGON"  # Simplified representation
                 
-                print(f"Field {field_id} cleaned data: {field_data}")
+                logger.debug("Field %s cleaned data: %s", field_id, field_data)
                 
                 # Validate coordinates with safe conversion
                 lat_raw = field_data.get('latitude')
                 lng_raw = field_data.get('longitude')
                 
-                print(f"Field {field_id} coordinates - lat_raw: {lat_raw} (type: {type(lat_raw)}), lng_raw: {lng_raw} (type: {type(lng_raw)})")
+                logger.debug("Field %s coordinates - lat_raw: %s (type: %s), lng_raw: %s (type: %s)",
+                             field_id, lat_raw, type(lat_raw), lng_raw, type(lng_raw))
                 
                 # Convert coordinates safely
                 latitude = safe_numeric_conversion(lat_raw, 'latitude')
                 longitude = safe_numeric_conversion(lng_raw, 'longitude')
                 
-                print(f"Field {field_id} converted coordinates - latitude: {latitude}, longitude: {longitude}")
+                logger.debug("Field %s converted coordinates - latitude: %s, longitude: %s", field_id, latitude, longitude)
                 
                 if latitude is None or longitude is None:
-                    print(f"Warning: Field {field_id} has NULL/invalid coordinates")
+                    logger.warning("Field %s has NULL/invalid coordinates", field_id)
                     return None
                 
                 # Validate coordinate ranges
                 if not (-90 <= latitude <= 90):
-                    print(f"Warning: Field {field_id} has invalid latitude: {latitude}")
+                    logger.warning("Field %s has invalid latitude: %s", field_id, latitude)
                     return None
                 
                 if not (-180 <= longitude <= 180):
-                    print(f"Warning: Field {field_id} has invalid longitude: {longitude}")
+                    logger.warning("Field %s has invalid longitude: %s", field_id, longitude)
                     return None
                 
                 # Update field_data with converted coordinates
@@ -203,26 +302,23 @@ class FieldsRepository:
                 area_ha = safe_numeric_conversion(area_raw, 'area_ha')
                 
                 if area_ha is not None and area_ha <= 0:
-                    print(f"Warning: Field {field_id} has non-positive area: {area_ha}")
+                    logger.warning("Field %s has non-positive area: %s", field_id, area_ha)
                     area_ha = None
                 
                 field_data['area_ha'] = area_ha
                 
-                print(f"Field {field_id} final cleaned data: {field_data}")
+                logger.debug("Field %s final cleaned data: %s", field_id, field_data)
                 
                 return field_data
                 
         except Exception as e:
-            print(f"Error fetching field {field_id}: {e}")
-            print(f"Error traceback: {traceback.format_exc()}")
+            logger.exception("Error fetching field %s: %s", field_id, e)
             return None
     
     def get_fields_by_owner(self, owner_entity_id: int, limit: int = 100) -> List[Dict[str, Any]]:
         """Get fields by owner with data cleaning"""
         try:
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor(dictionary=True)
-                
+            with self.db.get_ro_connection() as conn, conn.cursor(dictionary=True) as cursor:
                 query = """
                 SELECT 
                     id, farm_id, name, farmer_name, area_ha,
@@ -235,7 +331,6 @@ class FieldsRepository:
                 
                 cursor.execute(query, (owner_entity_id, limit))
                 raw_fields = cursor.fetchall()
-                cursor.close()
                 
                 # Clean and validate each field
                 valid_fields = []
@@ -251,7 +346,7 @@ class FieldsRepository:
                         longitude = safe_numeric_conversion(field.get('longitude'), 'longitude')
                         
                         if latitude is not None and longitude is not None:
-                            if -90 <= latitude <= 90 and -180 <= longitude <= 180:
+                            if _coords_ok(latitude, longitude):
                                 field['latitude'] = latitude
                                 field['longitude'] = longitude
                                 
@@ -261,21 +356,19 @@ class FieldsRepository:
                                 
                                 valid_fields.append(field)
                     except Exception as e:
-                        print(f"Error processing field {raw_field.get('id', 'unknown')}: {e}")
+                        logger.error("Error processing field %s: %s", raw_field.get('id', 'unknown'), e)
                         continue
                 
                 return valid_fields
                 
         except Exception as e:
-            print(f"Error fetching fields for owner {owner_entity_id}: {e}")
+            logger.error("Error fetching fields for owner %s: %s", owner_entity_id, e)
             return []
     
     def search_fields(self, filters: Dict[str, Any], limit: int = 100) -> List[Dict[str, Any]]:
         """Search fields with filters and data cleaning"""
         try:
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor(dictionary=True)
-                
+            with self.db.get_ro_connection() as conn, conn.cursor(dictionary=True) as cursor:
                 # Build dynamic query
                 where_clauses = []
                 params = []
@@ -312,7 +405,6 @@ class FieldsRepository:
                 
                 cursor.execute(query, params)
                 raw_fields = cursor.fetchall()
-                cursor.close()
                 
                 # Clean and validate fields
                 valid_fields = []
@@ -328,7 +420,7 @@ class FieldsRepository:
                         longitude = safe_numeric_conversion(field.get('longitude'), 'longitude')
                         
                         if latitude is not None and longitude is not None:
-                            if -90 <= latitude <= 90 and -180 <= longitude <= 180:
+                            if _coords_ok(latitude, longitude):
                                 field['latitude'] = latitude
                                 field['longitude'] = longitude
                                 
@@ -338,76 +430,112 @@ class FieldsRepository:
                                 
                                 valid_fields.append(field)
                     except Exception as e:
-                        print(f"Error processing field {raw_field.get('id', 'unknown')}: {e}")
+                        logger.error("Error processing field %s: %s", raw_field.get('id', 'unknown'), e)
                         continue
                 
                 return valid_fields
                 
         except Exception as e:
-            print(f"Error searching fields: {e}")
+            logger.error("Error searching fields: %s", e)
             return []
     
+    _INSERT_FIELD_QUERY = """
+    INSERT INTO fields 
+    (farm_id, name, farmer_name, farmer_phone, area_ha, location,
+     crop, variety, planting_date, irrigated, latitude, longitude, owner_entity_id)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """
+    
+    def _prepare_field_values(self, field_data: Dict[str, Any]) -> Optional[tuple]:
+        """Validate field data and build the INSERT values tuple (None if invalid)"""
+        # Validate coordinates before insertion
+        if 'latitude' in field_data and 'longitude' in field_data:
+            latitude = safe_numeric_conversion(field_data['latitude'], 'latitude')
+            longitude = safe_numeric_conversion(field_data['longitude'], 'longitude')
+            
+            if latitude is None or longitude is None:
+                logger.warning("Invalid coordinates for new field")
+                return None
+            
+            if not _coords_ok(latitude, longitude):
+                logger.warning("Coordinates out of range: lat=%s, lng=%s", latitude, longitude)
+                return None
+            
+            field_data['latitude'] = latitude
+            field_data['longitude'] = longitude
+        
+        # Validate area_ha
+        if 'area_ha' in field_data:
+            area_ha = safe_numeric_conversion(field_data['area_ha'], 'area_ha')
+            if area_ha is not None and area_ha <= 0:
+                area_ha = None
+            field_data['area_ha'] = area_ha
+        
+        return (
+            field_data.get('farm_id'),
+            field_data.get('name'),
+            field_data.get('farmer_name'),
+            field_data.get('farmer_phone'),
+            field_data.get('area_ha'),
+            field_data.get('location'),
+            field_data.get('crop'),
+            field_data.get('variety'),
+            field_data.get('planting_date'),
+            field_data.get('irrigated', 0),
+            field_data.get('latitude'),
+            field_data.get('longitude'),
+            field_data.get('owner_entity_id')
+        )
+    
     def create_field(self, field_data: Dict[str, Any]) -> Optional[int]:
         """Create a new field with validation"""
         try:
-            # Validate coordinates before insertion
-            if 'latitude' in field_data and 'longitude' in field_data:
-                latitude = safe_numeric_conversion(field_data['latitude'], 'latitude')
-                longitude = safe_numeric_conversion(field_data['longitude'], 'longitude')
-                
-                if latitude is None or longitude is None:
-                    print("Invalid coordinates for new field")
-                    return None
-                
-                if not (-90 <= latitude <= 90) or not (-180 <= longitude <= 180):
-                    print(f"Coordinates out of range: lat={latitude}, lng={longitude}")
-                    return None
-                
-                field_data['latitude'] = latitude
-                field_data['longitude'] = longitude
-            
-            # Validate area_ha
-            if 'area_ha' in field_data:
-                area_ha = safe_numeric_conversion(field_data['area_ha'], 'area_ha')
-                if area_ha is not None and area_ha <= 0:
-                    area_ha = None
-                field_data['area_ha'] = area_ha
+            values = self._prepare_field_values(field_data)
+            if values is None:
+                return None
             
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                query = """
-                INSERT INTO fields 
-                (farm_id, name, farmer_name, farmer_phone, area_ha, location,
-                 crop, variety, planting_date, irrigated, latitude, longitude, owner_entity_id)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """
-                
-                values = (
-                    field_data.get('farm_id'),
-                    field_data.get('name'),
-                    field_data.get('farmer_name'),
-                    field_data.get('farmer_phone'),
-                    field_data.get('area_ha'),
-                    field_data.get('location'),
-                    field_data.get('crop'),
-                    field_data.get('variety'),
-                    field_data.get('planting_date'),
-                    field_data.get('irrigated', 0),
-                    field_data.get('latitude'),
-                    field_data.get('longitude'),
-                    field_data.get('owner_entity_id')
-                )
-                
-                cursor.execute(query, values)
+            # Single-row insert - autocommit on the connection is fine here
+            with self.db.get_connection() as conn, conn.cursor() as cursor:
+                cursor.execute(self._INSERT_FIELD_QUERY, values)
                 field_id = cursor.lastrowid
-                cursor.close()
                 
                 return field_id
                 
         except Exception as e:
-            print(f"Error creating field: {e}")
+            logger.error("Error creating field: %s", e)
             return None
+    
+    def create_fields(self, fields_data: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """
+        Create many fields in a single transaction
+        
+        Rows failing validation are skipped (None in the result); the valid rows
+        are committed together, so a database error rolls back the whole batch.
+        
+        Returns:
+            list: New field IDs aligned with fields_data (None for rejected rows)
+        """
+        field_ids = [None] * len(fields_data)
+        batch = []
+        for i, field_data in enumerate(fields_data):
+            values = self._prepare_field_values(field_data)
+            if values is not None:
+                batch.append((i, values))
+        
+        if not batch:
+            return field_ids
+        
+        try:
+            with self.db.transaction() as conn, conn.cursor() as cursor:
+                for i, values in batch:
+                    cursor.execute(self._INSERT_FIELD_QUERY, values)
+                    field_ids[i] = cursor.lastrowid
+            
+            return field_ids
+            
+        except Exception as e:
+            logger.error("Error creating fields batch (%s rows rolled back): %s", len(batch), e)
+            return [None] * len(fields_data)
 
 class QuotesRepository:
     """Repository for quote-related database operations with data cleaning"""
@@ -418,9 +546,7 @@ class QuotesRepository:
     def save_quote(self, quote_data: Dict[str, Any]) -> Optional[str]:
         """Save quote to database with enhanced error handling"""
         try:
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor()
-                
+            with self.db.get_connection() as conn, conn.cursor() as cursor:
                 # Generate quote ID
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 field_suffix = quote_data.get('field_id', 'GEOM')
@@ -473,12 +599,11 @@ class QuotesRepository:
                 )
                 
                 cursor.execute(query, values)
-                cursor.close()
                 
                 return quote_id
                 
         except Exception as e:
-            print(f"Error saving quote: {e}")
+            logger.error("Error saving quote: %s", e)
             return None
     
     def _ensure_quotes_table(self, cursor):
@@ -510,14 +635,12 @@ class QuotesRepository:
                 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
             """)
         except Exception as e:
-            print(f"Error ensuring quotes table: {e}")
+            logger.error("Error ensuring quotes table: %s", e)
     
     def get_quote_by_id(self, quote_id: str) -> Optional[Dict[str, Any]]:
         """Get quote by ID with data cleaning"""
         try:
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor(dictionary=True)
-                
+            with self.db.get_ro_connection() as conn, conn.cursor(dictionary=True) as cursor:
                 query = """
                 SELECT quote_id, field_id, crop, year, quote_type,
                        sum_insured, gross_premium, premium_rate, payout_index,
@@ -528,36 +651,36 @@ class QuotesRepository:
                 
                 cursor.execute(query, (quote_id,))
                 raw_quote = cursor.fetchone()
-                cursor.close()
                 
                 if not raw_quote:
                     return None
                 
-                # Clean all values
+                # Clean all values (quote_data is decoded separately below)
+                quote_data = raw_quote.pop('quote_data', None)
                 quote = {}
                 for key, value in raw_quote.items():
                     quote[key] = clean_database_value(value)
                 
-                # Handle JSON data
-                if quote.get('quote_data'):
+                # Handle JSON data - the connector may already hand back a dict
+                # for JSON columns; only parse str/bytes payloads (json accepts
+                # bytes directly, so no intermediate decode). NULL stays None
+                if isinstance(quote_data, (str, bytes, bytearray)):
                     try:
-                        if isinstance(quote['quote_data'], str):
-                            quote['quote_data'] = json.loads(quote['quote_data'])
-                    except json.JSONDecodeError:
-                        quote['quote_data'] = {}
+                        quote_data = json.loads(quote_data) if quote_data else {}
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        quote_data = {}
+                quote['quote_data'] = quote_data
                 
                 return quote
                 
         except Exception as e:
-            print(f"Error fetching quote {quote_id}: {e}")
+            logger.error("Error fetching quote %s: %s", quote_id, e)
             return None
     
     def get_quotes_by_field(self, field_id: int, limit: int = 20) -> List[Dict[str, Any]]:
         """Get quotes for a field with data cleaning"""
         try:
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor(dictionary=True)
-                
+            with self.db.get_ro_connection() as conn, conn.cursor(dictionary=True) as cursor:
                 query = """
                 SELECT quote_id, crop, year, quote_type, sum_insured,
                        gross_premium, premium_rate, payout_index, created_at
@@ -569,7 +692,6 @@ class QuotesRepository:
                 
                 cursor.execute(query, (field_id, limit))
                 raw_quotes = cursor.fetchall()
-                cursor.close()
                 
                 # Clean all quotes
                 quotes = []
@@ -582,7 +704,7 @@ class QuotesRepository:
                 return quotes
                 
         except Exception as e:
-            print(f"Error fetching quotes for field {field_id}: {e}")
+            logger.error("Error fetching quotes for field %s: %s", field_id, e)
             return []
 
 def init_database_tables():
@@ -590,9 +712,7 @@ def init_database_tables():
     db = DatabaseManager()
     
     try:
-        with db.get_connection() as conn:
-            cursor = conn.cursor()
-            
+        with db.get_connection() as conn, conn.cursor() as cursor:
             # Create quotes table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS quotes (
@@ -626,9 +746,8 @@ def init_database_tables():
             except mysql.connector.Error:
                 pass
             
-            cursor.close()
-            print("✅ Database tables initialized successfully")
+            logger.info("Database tables initialized successfully")
             
     except Exception as e:
-        print(f"❌ Error initializing database tables: {e}")
+        logger.error("Error initializing database tables: %s", e)
         raise
@@ -4,51 +4,232 @@ Google Earth Engine client for rainfall data extraction
 
 import ee
 import json
+import logging
 import os
+import hashlib
+import random
+import threading
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from numpy.lib.stride_tricks import sliding_window_view
 from google.oauth2 import service_account
 from datetime import datetime, timedelta
 from config import Config
 
+# Runtime errors and retries go through logging, filtered by Config.LOG_LEVEL
+logger = logging.getLogger(__name__)
+
+# Try to import Numba for the planting trigger scan, with NumPy fallback
+try:
+    from numba import njit
+    USING_NUMBA = True
+    print("INFO: Numba JIT enabled for planting trigger scan")
+except ImportError:
+    USING_NUMBA = False
+    print("INFO: Numba not installed - planting trigger scan uses NumPy fallback")
+
+# Shared pool for concurrent Earth Engine requests (the high-volume endpoint
+# is built for parallel calls; the workload is network-bound)
+_EE_POOL = ThreadPoolExecutor(max_workers=Config.GEE_MAX_WORKERS, thread_name_prefix='ee')
+
+# Caps requests in flight across all threads, pooled or not
+_EE_REQUEST_SLOTS = threading.BoundedSemaphore(Config.GEE_MAX_WORKERS)
+
+# Error text of EE failures worth retrying (throttling, server-side hiccups)
+_TRANSIENT_EE_ERRORS = (
+    'too many requests', 'quota', 'rate limit', '429',
+    'internal error', 'backend error', 'service unavailable'
+)
+
+def _is_transient_ee_error(error):
+    """True for EE failures worth retrying: throttling, server hiccups, dropped connections"""
+    if not isinstance(error, ee.EEException):
+        return True  # ConnectionError / TimeoutError
+    message = str(error).lower()
+    return any(marker in message for marker in _TRANSIENT_EE_ERRORS)
+
+def get_info_with_retry(ee_object):
+    """
+    getInfo() with exponential backoff on throttling and transient EE errors
+    
+    Permanent errors (bad arguments, missing assets) are raised immediately so
+    they are not retried; after Config.GEE_MAX_RETRIES attempts the last error
+    is raised to the caller's usual error handling. Delays are jittered so
+    concurrent requests throttled together do not retry in lockstep.
+    """
+    attempts = max(1, Config.GEE_MAX_RETRIES)
+    for attempt in range(attempts):
+        try:
+            with _EE_REQUEST_SLOTS:
+                return ee_object.getInfo()
+        except (ee.EEException, ConnectionError, TimeoutError) as e:
+            if not _is_transient_ee_error(e) or attempt == attempts - 1:
+                raise
+            delay = random.uniform(0.5, 1.0) * min(2 ** attempt, 30)
+            logger.warning("Transient Earth Engine error (attempt %s/%s), retrying in %.1fs: %s", attempt + 1, attempts, delay, e)
+            time.sleep(delay)
+
+def ee_executor():
+    """
+    Shared thread pool for concurrent Earth Engine requests
+    
+    Fan-out from request threads goes through this one pool so concurrent
+    quotes stay within Config.GEE_MAX_WORKERS workers per process.
+    """
+    return _EE_POOL
+
+def _rolling_sums(values, window):
+    """
+    Sum every `window`-day slice of a daily series
+    
+    Days are added in order, so each total matches Python's sum() exactly
+    and values sitting on a trigger threshold are not flipped by rounding.
+    
+    Args:
+        values: 1-D np.ndarray of daily values
+        window: int - window length in days
+    
+    Returns:
+        np.ndarray: len(values) - window + 1 window totals
+    """
+    windows = sliding_window_view(values, window)
+    totals = windows[:, 0].copy()
+    for offset in range(1, window):
+        totals += windows[:, offset]
+    return totals
+
+@lru_cache(maxsize=1024)
+def _phase_end_date(start_date, phase_days):
+    """End date string (exclusive) for a phase starting on start_date ('YYYY-MM-DD')"""
+    end_dt = datetime.strptime(start_date, '%Y-%m-%d') + timedelta(days=phase_days)
+    return end_dt.strftime('%Y-%m-%d')
+
+def _first_planting_hit(rainfall, trigger_mm, min_rain_days, rain_day_mm):
+    """
+    Find the first 7-day window meeting the planting trigger
+    
+    Window totals add the days in order (as _rolling_sums does); the
+    rain-day count is kept as a running add-new/drop-old tally.
+    
+    Returns:
+        int: start index of the first qualifying window, or -1
+    """
+    n = rainfall.shape[0]
+    rain_days = 0
+    for j in range(min(n, 7)):
+        if rainfall[j] >= rain_day_mm:
+            rain_days += 1
+    
+    for i in range(n - 6):
+        if i > 0:
+            if rainfall[i - 1] >= rain_day_mm:
+                rain_days -= 1
+            if rainfall[i + 6] >= rain_day_mm:
+                rain_days += 1
+        
+        if rain_days >= min_rain_days:
+            window_total = rainfall[i]
+            for j in range(i + 1, i + 7):
+                window_total += rainfall[j]
+            if window_total >= trigger_mm:
+                return i
+    
+    return -1
+
+def _first_planting_hit_numpy(rainfall, trigger_mm, min_rain_days, rain_day_mm):
+    """Vectorized _first_planting_hit for use without Numba"""
+    if rainfall.shape[0] < 7:
+        return -1
+    seven_day_totals = _rolling_sums(rainfall, 7)
+    rain_day_counts = np.cumsum(np.concatenate(([0], rainfall >= rain_day_mm)))
+    rain_day_counts = rain_day_counts[7:] - rain_day_counts[:-7]
+    hits = np.flatnonzero((seven_day_totals >= trigger_mm) & (rain_day_counts >= min_rain_days))
+    return int(hits[0]) if len(hits) else -1
+
+if USING_NUMBA:
+    # Eager compilation for the one signature used (served from the on-disk cache afterwards)
+    _first_planting_hit = njit("i8(f8[::1], f8, i8, f8)", cache=True)(_first_planting_hit)
+else:
+    _first_planting_hit = _first_planting_hit_numpy
+
+# Earth Engine is initialized once per process; later calls are no-ops
+_EE_INITIALIZED = False
+_EE_INIT_LOCK = threading.Lock()
+
 def initialize_earth_engine():
-    """Initialize Google Earth Engine authentication"""
-    try:
-        # Try service account file first
-        if Config.GOOGLE_APPLICATION_CREDENTIALS and os.path.exists(Config.GOOGLE_APPLICATION_CREDENTIALS):
-            credentials = service_account.Credentials.from_service_account_file(
-                Config.GOOGLE_APPLICATION_CREDENTIALS,
-                scopes=['https://www.googleapis.com/auth/earthengine.readonly']
-            )
-            ee.Initialize(credentials=credentials, opt_url='https://earthengine-highvolume.googleapis.com')
+    """Initialize Google Earth Engine authentication (idempotent and thread-safe)"""
+    global _EE_INITIALIZED
+    
+    if _EE_INITIALIZED:
+        return True
+    
+    with _EE_INIT_LOCK:
+        if _EE_INITIALIZED:
             return True
         
-        # Try JSON credentials from environment
-        elif Config.GEE_SERVICE_ACCOUNT_CREDENTIALS_JSON:
-            creds_json = json.loads(Config.GEE_SERVICE_ACCOUNT_CREDENTIALS_JSON)
-            credentials = service_account.Credentials.from_service_account_info(
-                creds_json,
-                scopes=['https://www.googleapis.com/auth/earthengine.readonly']
-            )
-            ee.Initialize(credentials=credentials, opt_url='https://earthengine-highvolume.googleapis.com')
+        try:
+            # Try service account file first
+            if Config.GOOGLE_APPLICATION_CREDENTIALS and os.path.exists(Config.GOOGLE_APPLICATION_CREDENTIALS):
+                credentials = service_account.Credentials.from_service_account_file(
+                    Config.GOOGLE_APPLICATION_CREDENTIALS,
+                    scopes=['https://www.googleapis.com/auth/earthengine.readonly']
+                )
+            
+            # Try JSON credentials from environment
+            elif Config.GEE_SERVICE_ACCOUNT_CREDENTIALS_JSON:
+                creds_json = json.loads(Config.GEE_SERVICE_ACCOUNT_CREDENTIALS_JSON)
+                credentials = service_account.Credentials.from_service_account_info(
+                    creds_json,
+                    scopes=['https://www.googleapis.com/auth/earthengine.readonly']
+                )
+            
+            else:
+                raise EnvironmentError("No valid GEE credentials found")
+            
+            ee.Initialize(credentials=credentials, opt_url=Config.GEE_API_URL)
+            _EE_INITIALIZED = True
             return True
-        
-        else:
-            raise EnvironmentError("No valid GEE credentials found")
             
-    except Exception as e:
-        print(f"Failed to initialize Earth Engine: {e}")
-        raise
+        except Exception as e:
+            logger.error("Failed to initialize Earth Engine: %s", e)
+            raise
 
 class RainfallExtractor:
     """Handles rainfall data extraction from CHIRPS via Google Earth Engine"""
     
+    DAILY_CACHE_SIZE = 256  # Cached (geometry, date range) daily series
+    SIMPLIFY_ERROR_FRACTION = 0.01  # Boundary tolerance as a fraction of the CHIRPS pixel
+    
     def __init__(self):
         self.collection_id = Config.CHIRPS_COLLECTION_ID
         self.scale = Config.CHIRPS_SCALE
+        self._daily_cache = {}
+        self._cache_lock = threading.Lock()
+    
+    @staticmethod
+    def _geometry_key(geometry):
+        """Stable cache key for an ee.Geometry"""
+        return hashlib.sha1(geometry.serialize().encode()).hexdigest()
+    
+    def _simplify(self, geometry):
+        """
+        Reduce a field boundary to the detail a ~5.5km CHIRPS pixel can resolve
+        
+        Digitized field polygons can carry hundreds of vertices; simplifying
+        to ~1% of the pixel size leaves the pixel coverage weights of the
+        mean reduction effectively unchanged while cutting its cost.
+        """
+        return geometry.simplify(maxError=self.scale * self.SIMPLIFY_ERROR_FRACTION)
     
     def get_daily_rainfall(self, geometry, start_date, end_date):
         """
         Extract daily rainfall data for a geometry and date range
         
+        Series are cached per (geometry, date range), so repeated analyses
+        of the same field do not go back to Earth Engine.
+        
         Args:
             geometry: ee.Geometry object
             start_date: str in 'YYYY-MM-DD' format
@@ -57,51 +238,129 @@ class RainfallExtractor:
         Returns:
             list: Daily rainfall values
         """
+        dates, rainfall = self.get_daily_rainfall_arrays(geometry, start_date, end_date)
+        return self._to_records(dates, rainfall)
+    
+    def get_daily_rainfall_arrays(self, geometry, start_date, end_date):
+        """
+        Extract daily rainfall as NumPy arrays (cached)
+        
+        Args:
+            geometry: ee.Geometry object
+            start_date: str in 'YYYY-MM-DD' format
+            end_date: str in 'YYYY-MM-DD' format
+        
+        Returns:
+            tuple: (dates datetime64[D] array, rainfall float64 array in mm)
+        """
+        cache_key = (self._geometry_key(geometry), start_date, end_date)
+        cached = self._cached_series(*cache_key)
+        if cached is not None:
+            return cached
+        
+        dates, rainfall = self._fetch_daily_rainfall(geometry, start_date, end_date)
+        
+        # Only cache successful fetches; evict the oldest entry when full
+        if len(dates):
+            dates.flags.writeable = False
+            rainfall.flags.writeable = False
+            with self._cache_lock:
+                if len(self._daily_cache) >= self.DAILY_CACHE_SIZE:
+                    self._daily_cache.pop(next(iter(self._daily_cache)), None)
+                self._daily_cache[cache_key] = (dates, rainfall)
+        
+        return dates, rainfall
+    
+    def _cached_series(self, geometry_key, start_date, end_date):
+        """
+        Look up a cached daily series, slicing it from a cached wider window if needed
+        
+        e.g. a phase's rolling-window analysis reuses the planting-season
+        series already fetched for the same field instead of going back to EE.
+        
+        Returns:
+            tuple: (dates, rainfall) or None when nothing cached covers the window
+        """
+        cached = self._daily_cache.get((geometry_key, start_date, end_date))
+        if cached is not None:
+            return cached
+        
+        with self._cache_lock:
+            entries = list(self._daily_cache.items())
+        
+        for (key, cached_start, cached_end), (dates, rainfall) in entries:
+            if key == geometry_key and cached_start <= start_date and end_date <= cached_end:
+                window = (dates >= np.datetime64(start_date)) & (dates < np.datetime64(end_date))
+                return dates[window], rainfall[window]
+        
+        return None
+    
+    def _fetch_daily_rainfall(self, geometry, start_date, end_date):
+        """Fetch daily rainfall from Earth Engine (uncached)"""
         try:
+            # CHIRPS images are global, so filterBounds() would not drop any
             collection = ee.ImageCollection(self.collection_id) \
-                .filterBounds(geometry) \
                 .filterDate(start_date, end_date) \
-                .select('precipitation')
+                .select('precipitation') \
+                .sort('system:time_start')
+            
+            # Stack the days into one multi-band image and reduce it once
+            # (one band per day, named 'YYYYMMDD_precipitation')
+            band_means = get_info_with_retry(collection.toBands().reduceRegion(
+                reducer=ee.Reducer.mean(),
+                geometry=self._simplify(geometry),
+                scale=self.scale,
+                maxPixels=1e13
+            ))
             
-            # Get daily images
-            def extract_daily_value(image):
-                value = image.reduceRegion(
-                    reducer=ee.Reducer.mean(),
-                    geometry=geometry,
-                    scale=self.scale,
-                    maxPixels=1e13
-                ).get('precipitation')
-                
-                return ee.Feature(None, {
-                    'date': image.date().format('YYYY-MM-dd'),
-                    'rainfall': value
-                })
-            
-            features = collection.map(extract_daily_value)
-            feature_collection = ee.FeatureCollection(features)
-            
-            # Get the data
-            data = feature_collection.getInfo()
-            
-            # Extract values
-            daily_data = []
-            for feature in data['features']:
-                props = feature['properties']
-                daily_data.append({
-                    'date': props['date'],
-                    'rainfall': props['rainfall'] if props['rainfall'] is not None else 0
-                })
-            
-            return sorted(daily_data, key=lambda x: x['date'])
+            return self._parse_daily_bands(band_means)
             
         except Exception as e:
-            print(f"Error extracting daily rainfall: {e}")
-            return []
+            logger.error("Error extracting daily rainfall: %s", e)
+            return self._parse_daily_bands({})
+    
+    @staticmethod
+    def _parse_daily_bands(band_means):
+        """
+        Convert {'YYYYMMDD_precipitation': mean} into date-sorted arrays
+        
+        Bands arrive in date order (the collection is sorted server-side and
+        the band names sort chronologically), so sorting is only a fallback.
+        
+        Returns:
+            tuple: (dates datetime64[D] array, rainfall float64 array)
+        """
+        days = []
+        values = []
+        for band_name, value in band_means.items():
+            day, _, band = band_name.partition('_')
+            if band != 'precipitation' or not day.isdigit():
+                continue  # Not a daily precipitation band
+            days.append(f"{day[:4]}-{day[4:6]}-{day[6:8]}")
+            values.append(value if value is not None else 0.0)
+        
+        dates = np.array(days, dtype='datetime64[D]')
+        rainfall = np.array(values, dtype=np.float64)
+        if len(dates) > 1 and not (dates[1:] >= dates[:-1]).all():
+            order = np.argsort(dates, kind='stable')
+            return dates[order], rainfall[order]
+        return dates, rainfall
+    
+    @staticmethod
+    def _to_records(dates, rainfall):
+        """Materialize [{'date', 'rainfall'}] records for callers of the list format"""
+        return [
+            {'date': date, 'rainfall': value}
+            for date, value in zip(np.datetime_as_string(dates, unit='D').tolist(), rainfall.tolist())
+        ]
     
     def get_period_rainfall(self, geometry, start_date, end_date):
         """
         Get total rainfall for a period
         
+        Summed locally when the daily series for the same window is already
+        cached; otherwise reduced server-side on the summed image.
+        
         Args:
             geometry: ee.Geometry object
             start_date: str in 'YYYY-MM-DD' format  
@@ -111,23 +370,26 @@ class RainfallExtractor:
             float: Total rainfall in mm
         """
         try:
+            cached = self._cached_series(self._geometry_key(geometry), start_date, end_date)
+            if cached is not None:
+                return sum(cached[1].tolist())
+            
             collection = ee.ImageCollection(self.collection_id) \
-                .filterBounds(geometry) \
                 .filterDate(start_date, end_date) \
                 .select('precipitation')
             
             total_rainfall = collection.sum().reduceRegion(
                 reducer=ee.Reducer.mean(),
-                geometry=geometry,
+                geometry=self._simplify(geometry),
                 scale=self.scale,
                 maxPixels=1e13
             ).get('precipitation')
             
-            result = total_rainfall.getInfo()
+            result = get_info_with_retry(total_rainfall)
             return result if result is not None else 0
             
         except Exception as e:
-            print(f"Error extracting period rainfall: {e}")
+            logger.error("Error extracting period rainfall: %s", e)
             return 0
     
     def detect_planting_date(self, geometry, year, crop_type="maize"):
@@ -143,58 +405,82 @@ class RainfallExtractor:
             tuple: (planting_date_str, description)
         """
         try:
-            # Define search windows
-            early_start = f"{year}-11-01"
-            early_end = f"{year}-12-15"
-            late_start = f"{year}-12-01" 
-            late_end = f"{year+1}-01-31"
-            
-            # Check early window first
-            planting_date = self._check_planting_window(geometry, early_start, early_end, "early")
-            if planting_date:
-                return planting_date
+            # Fetch the whole season once; the (overlapping) windows are sliced locally
+            season_start, season_end = self._planting_season_range(year)
+            dates, rainfall = self.get_daily_rainfall_arrays(geometry, season_start, season_end)
             
-            # Check late window
-            planting_date = self._check_planting_window(geometry, late_start, late_end, "late")
-            if planting_date:
-                return planting_date
-            
-            # Fallback to default date
-            from core.crops import get_crop_config
-            crop_config = get_crop_config(crop_type)
-            default_date = f"{year}-{crop_config.get('default_planting_date', '11-15')}"
-            
-            return default_date, f"Default planting date (no adequate rainfall trigger detected)"
+            return self._detect_planting_from_season(dates, rainfall, year, crop_type)
             
         except Exception as e:
-            print(f"Error detecting planting date: {e}")
+            logger.error("Error detecting planting date: %s", e)
             default_date = f"{year}-11-15"
             return default_date, f"Default planting date (error: {str(e)})"
     
-    def _check_planting_window(self, geometry, start_date, end_date, window_name):
-        """Check for planting triggers in a specific window"""
-        try:
-            # Get daily rainfall for the window
-            daily_data = self.get_daily_rainfall(geometry, start_date, end_date)
-            
-            if len(daily_data) < 7:
-                return None
+    @staticmethod
+    def _planting_season_range(year):
+        """Date range covering both planting windows (end exclusive)"""
+        return f"{year}-11-01", f"{year+1}-01-31"
+    
+    def _detect_planting_from_season(self, dates, rainfall, year, crop_type):
+        """
+        Find the planting trigger in a season's daily rainfall with a single scan
+        
+        The early (Nov 1 - Dec 15) and late (Dec 1 - Jan 31) windows overlap,
+        so one pass over the season finds the first qualifying 7-day period
+        and its position decides which window it is reported under.
+        """
+        # Window boundaries as indices into the date-sorted series (ends exclusive)
+        season_start = np.searchsorted(dates, np.datetime64(f"{year}-11-01"))
+        early_end = np.searchsorted(dates, np.datetime64(f"{year}-12-15"))
+        late_start = np.searchsorted(dates, np.datetime64(f"{year}-12-01"))
+        season_end = np.searchsorted(dates, np.datetime64(f"{year+1}-01-31"))
+        
+        i = self._first_trigger(rainfall[season_start:season_end])
+        if i >= 0:
+            i += season_start
             
-            # Check 7-day rolling windows
-            for i in range(len(daily_data) - 6):
-                seven_day_total = sum(day['rainfall'] for day in daily_data[i:i+7])
-                rain_days = sum(1 for day in daily_data[i:i+7] if day['rainfall'] >= 3)
-                
-                if seven_day_total >= Config.PLANTING_TRIGGER_RAINFALL and rain_days >= Config.PLANTING_MIN_RAIN_DAYS:
-                    planting_date = daily_data[i+1]['date']  # Plant day after first day of 7-day period
-                    description = f"Detected in {window_name} window: {seven_day_total:.1f}mm over 7 days with {rain_days} rain days"
-                    return planting_date, description
+            # Early window first: the whole 7-day period must end before Dec 15
+            if i + 7 <= early_end:
+                return self._planting_result(dates, rainfall, i, "early")
             
-            return None
+            if i >= late_start:
+                return self._planting_result(dates, rainfall, i, "late")
             
-        except Exception as e:
-            print(f"Error checking planting window {window_name}: {e}")
-            return None
+            # Only reachable with gaps in the series: the first hit straddles
+            # Dec 15 but starts before Dec 1, so rescan the late window alone
+            j = self._first_trigger(rainfall[late_start:season_end])
+            if j >= 0:
+                return self._planting_result(dates, rainfall, late_start + j, "late")
+        
+        # Fallback to default date
+        from core.crops import get_crop_config
+        crop_config = get_crop_config(crop_type)
+        default_date = f"{year}-{crop_config.get('default_planting_date', '11-15')}"
+        
+        return default_date, f"Default planting date (no adequate rainfall trigger detected)"
+    
+    @staticmethod
+    def _first_trigger(rainfall):
+        """Start index of the first 7-day period meeting the planting trigger, or -1"""
+        if len(rainfall) < 7:
+            return -1
+        
+        # Fresh contiguous float64 copy (cached series are read-only views)
+        return _first_planting_hit(
+            np.array(rainfall, dtype=np.float64),
+            float(Config.PLANTING_TRIGGER_RAINFALL), int(Config.PLANTING_MIN_RAIN_DAYS), 3.0
+        )
+    
+    @staticmethod
+    def _planting_result(dates, rainfall, i, window_name):
+        """(planting_date, description) for the trigger period starting at index i"""
+        window = rainfall[i:i+7].tolist()
+        seven_day_total = sum(window)
+        rain_days = sum(1 for value in window if value >= 3)
+        
+        planting_date = str(dates[i+1])  # Plant day after first day of 7-day period
+        description = f"Detected in {window_name} window: {seven_day_total:.1f}mm over 7 days with {rain_days} rain days"
+        return planting_date, description
     
     def get_rolling_window_analysis(self, geometry, start_date, phase_days, window_days=10):
         """
@@ -210,33 +496,29 @@ class RainfallExtractor:
             list: Rolling window rainfall totals
         """
         try:
-            # Calculate phase end date
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-            end_dt = start_dt + timedelta(days=phase_days)
-            end_date = end_dt.strftime('%Y-%m-%d')
+            # Calculate phase end date (memoized - the same phases recur across fields)
+            end_date = _phase_end_date(start_date, phase_days)
             
             # Get daily rainfall
-            daily_data = self.get_daily_rainfall(geometry, start_date, end_date)
+            dates, rainfall = self.get_daily_rainfall_arrays(geometry, start_date, end_date)
             
-            if len(daily_data) < window_days:
+            if len(rainfall) < window_days:
                 return []
             
             # Calculate rolling windows
-            rolling_totals = []
-            for i in range(len(daily_data) - window_days + 1):
-                window_total = sum(day['rainfall'] for day in daily_data[i:i+window_days])
-                window_start = daily_data[i]['date']
-                window_end = daily_data[i+window_days-1]['date']
-                
-                rolling_totals.append({
-                    'period': i + 1,
-                    'start_date': window_start,
-                    'end_date': window_end,
-                    'rainfall_mm': round(window_total, 1)
-                })
+            window_totals = [round(total, 1) for total in _rolling_sums(rainfall, window_days).tolist()]
+            date_strings = np.datetime_as_string(dates, unit='D').tolist()
             
-            return rolling_totals
+            return [
+                {
+                    'period': i + 1,
+                    'start_date': date_strings[i],
+                    'end_date': date_strings[i+window_days-1],
+                    'rainfall_mm': window_total
+                }
+                for i, window_total in enumerate(window_totals)
+            ]
             
         except Exception as e:
-            print(f"Error in rolling window analysis: {e}")
+            logger.error("Error in rolling window analysis: %s", e)
             return []
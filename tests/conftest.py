@@ -0,0 +1,8 @@
+"""
+Shared pytest setup: make the application packages importable from tests/
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
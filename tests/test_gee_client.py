@@ -0,0 +1,87 @@
+"""
+Tests for the Earth Engine request retry helper
+"""
+
+import pytest
+
+ee = pytest.importorskip("ee")
+pytest.importorskip("google.oauth2")
+
+from config import Config
+from core import gee_client
+
+
+class FakeRequest:
+    """Stands in for an ee.ComputedObject: raises the queued errors, then returns"""
+    
+    def __init__(self, *errors, result=None):
+        self.errors = list(errors)
+        self.result = result
+        self.calls = 0
+    
+    def getInfo(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.result
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Record backoff delays instead of sleeping"""
+    delays = []
+    monkeypatch.setattr(gee_client.time, "sleep", delays.append)
+    monkeypatch.setattr(Config, "GEE_MAX_RETRIES", 4)
+    return delays
+
+
+@pytest.mark.parametrize("message", [
+    "Too many requests",
+    "Earth Engine quota exceeded",
+    "Internal error",
+    "Service unavailable",
+])
+def test_transient_ee_errors_are_retried(message, no_sleep):
+    request = FakeRequest(ee.EEException(message), result={"ok": 1})
+    
+    assert gee_client.get_info_with_retry(request) == {"ok": 1}
+    assert request.calls == 2
+    assert len(no_sleep) == 1
+
+
+def test_connection_errors_are_retried():
+    request = FakeRequest(ConnectionError("reset"), TimeoutError("slow"), result=[])
+    
+    assert gee_client.get_info_with_retry(request) == []
+    assert request.calls == 3
+
+
+@pytest.mark.parametrize("message", [
+    "Image.load: Image asset 'missing' not found.",
+    "User memory limit exceeded.",
+    "Invalid argument specified for ee.Date()",
+])
+def test_permanent_ee_errors_are_raised_immediately(message, no_sleep):
+    request = FakeRequest(ee.EEException(message))
+    
+    with pytest.raises(ee.EEException):
+        gee_client.get_info_with_retry(request)
+    assert request.calls == 1
+    assert no_sleep == []
+
+
+def test_retries_stop_after_max_attempts(no_sleep):
+    request = FakeRequest(*[ee.EEException("Too many requests")] * 10)
+    
+    with pytest.raises(ee.EEException):
+        gee_client.get_info_with_retry(request)
+    assert request.calls == Config.GEE_MAX_RETRIES
+    assert len(no_sleep) == Config.GEE_MAX_RETRIES - 1
+
+
+def test_backoff_grows_exponentially_with_jitter(no_sleep):
+    request = FakeRequest(*[ee.EEException("Too many requests")] * 3, result=1)
+    
+    gee_client.get_info_with_retry(request)
+    for attempt, delay in enumerate(no_sleep):
+        assert 0.5 * 2 ** attempt <= delay <= 2 ** attempt
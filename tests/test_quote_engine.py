@@ -0,0 +1,82 @@
+"""
+Tests for the quote engine's per-season drought impact memo
+"""
+
+import zlib
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("ee")
+pytest.importorskip("google.oauth2")
+
+from core.quote_engine import CalibratedQuoteEngine
+
+PARAMS = {
+    'crop': 'maize',
+    'latitude': -18.0,
+    'longitude': 31.0,
+    'zone': 'auto_detect',
+    'expected_yield': 3.0,
+    'price_per_ton': 300.0,
+    'area_ha': 2.0,
+    'deductible_rate': 0.05,
+    'custom_loadings': {},
+    'quote_type': 'historical'
+}
+
+PLANTING_DATES = {
+    2013: '2012-11-20',
+    2014: '2013-11-12',
+    2015: '2014-11-25',
+    2016: '2015-11-18'
+}
+
+
+def _daily_rainfall(day: date) -> float:
+    """
+    Deterministic synthetic CHIRPS value for a calendar day
+    
+    Steady light rain keeps every phase short of its water need, so each
+    day's rainfall moves the cumulative deficit (and the priced impact).
+    """
+    return 1.5 + zlib.crc32(day.isoformat().encode()) % 10 / 10
+
+
+def _fetch_chunk(point, location, chunk_year, chunk_start, chunk_end):
+    """Stands in for the EE chunk query: filterDate excludes chunk_end"""
+    day = date.fromisoformat(chunk_start)
+    end = date.fromisoformat(chunk_end)
+    lookup = {}
+    while day < end:
+        lookup[day.isoformat()] = _daily_rainfall(day)
+        day += timedelta(days=1)
+    return lookup
+
+
+def _engine():
+    engine = CalibratedQuoteEngine()
+    engine._fetch_daily_rainfall_chunk = _fetch_chunk
+    engine._get_chirps_collection = lambda: None
+    return engine
+
+
+def _quote_years(engine, last_year):
+    planting_dates = {year: day for year, day in PLANTING_DATES.items() if year <= last_year}
+    return engine._perform_calibrated_batch_analysis(PARAMS, planting_dates)
+
+
+@pytest.mark.parametrize("first_year, second_year", [(2015, 2016), (2016, 2015)])
+def test_warm_engine_matches_cold_engine(first_year, second_year):
+    warm = _engine()
+    _quote_years(warm, first_year)
+    
+    assert _quote_years(warm, second_year) == _quote_years(_engine(), second_year)
+
+
+def test_repeat_quote_is_served_from_the_memo():
+    engine = _engine()
+    first = _quote_years(engine, 2016)
+    
+    assert len(engine._drought_impact_cache) > 0
+    assert _quote_years(engine, 2016) == first